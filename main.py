@@ -12,53 +12,79 @@ Usage:
 import sys
 import os
 import json
+import stat
 import argparse
+from collections import Counter
 from scanner import PQCScanner
 
+# orjson serializes large finding lists several times faster than the stdlib
+# encoder; fall back to json so it stays an optional dependency.
+try:
+    import orjson
 
-def print_banner():
-    """Display the scanner banner."""
-    print("""
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Banner encoded to UTF-8 bytes once at import so printing it is a single
+# buffer write with no per-run string construction or re-encoding
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                     SENTINEL-PQC SCANNER                         ║
 ║            Post-Quantum Cryptography Risk Analyzer               ║
 ╚═══════════════════════════════════════════════════════════════════╝
-    """)
+    \n""".encode('utf-8')
+
+
+def print_banner():
+    """Display the scanner banner."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_BANNER)
+    sys.stdout.buffer.flush()
+
+
+# ANSI colors per risk level; module-level so print_finding doesn't rebuild
+# the table on every call
+RISK_COLORS = {
+    "CRITICAL": "\033[91m",  # Red
+    "HIGH": "\033[93m",      # Yellow
+    "MEDIUM": "\033[94m",    # Blue
+    "LOW": "\033[92m",       # Green
+    "UNKNOWN": "\033[90m"    # Gray
+}
 
 
 def print_finding(finding, index):
     """Pretty-print a single finding."""
-    risk_colors = {
-        "CRITICAL": "\033[91m",  # Red
-        "HIGH": "\033[93m",      # Yellow
-        "MEDIUM": "\033[94m",    # Blue
-        "LOW": "\033[92m",       # Green
-        "UNKNOWN": "\033[90m"    # Gray
-    }
     reset = "\033[0m"
-    
+
     risk = finding["risk"]
-    color = risk_colors.get(risk, "")
-    
-    print(f"\n[{index}] {color}■ {risk}{reset}")
-    print(f"    File: {finding['file']}")
-    print(f"    Line: {finding['line']}")
-    print(f"    Algorithm: {finding['algo']}.{finding['method']}()")
-    print(f"    Key Size: {finding['bits']} bits")
-    print(f"    Context: {finding['context']}")
+    color = RISK_COLORS.get(risk, "")
+
+    # One write per finding instead of six print() calls, each of which
+    # would grab the stdout lock and flush line-by-line
+    sys.stdout.write(
+        f"\n[{index}] {color}■ {risk}{reset}\n"
+        f"    File: {finding['file']}\n"
+        f"    Line: {finding['line']}\n"
+        f"    Algorithm: {finding['algo']}.{finding['method']}()\n"
+        f"    Key Size: {finding['bits']} bits\n"
+        f"    Context: {finding['context']}\n"
+    )
 
 
 def print_summary(findings):
     """Print a summary of all findings by risk level."""
-    risk_counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0, "UNKNOWN": 0}
-    
-    for f in findings:
-        risk = f["risk"]
-        if risk in risk_counts:
-            risk_counts[risk] += 1
-        else:
-            risk_counts["UNKNOWN"] += 1
-    
+    # Counter tallies in C; unrecognized labels fold into UNKNOWN and missing
+    # levels read back as 0
+    risk_counts = Counter(
+        f["risk"] if f["risk"] in RISK_COLORS else "UNKNOWN"
+        for f in findings
+    )
+
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
@@ -111,11 +137,14 @@ def main():
     
     args = parser.parse_args()
     
-    # Validate path
-    if not os.path.exists(args.path):
+    # Validate path with a single stat instead of separate exists/isfile
+    # probes further down
+    try:
+        st = os.stat(args.path)
+    except OSError:
         print(f"Error: Path not found: {args.path}")
         sys.exit(1)
-    
+
     print_banner()
     
     # Initialize scanner
@@ -125,7 +154,7 @@ def main():
     print(f"🔍 Scanning: {os.path.abspath(args.path)}")
     print("-" * 60)
     
-    if os.path.isfile(args.path):
+    if stat.S_ISREG(st.st_mode):
         findings = scanner.scan_file(args.path)
     else:
         findings = scanner.scan_directory(args.path)
@@ -144,11 +173,11 @@ def main():
     
     # Save output
     if args.cbom:
-        output = scanner.generate_cbom(findings, args.output)
+        scanner.generate_cbom(findings, args.output)
         print(f"\n📄 CycloneDX CBOM saved to: {args.output}")
     else:
-        with open(args.output, 'w') as f:
-            json.dump(findings, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_json_dumps(findings))
         print(f"\n📄 Findings saved to: {args.output}")
 
 
@@ -15,10 +15,30 @@ Usage:
 """
 
 import json
+import mmap
 import os
+import sys
 import argparse
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+# orjson parses large CBOMs several times faster than the stdlib decoder;
+# fall back to json so it stays an optional dependency.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
 
 
 # =============================================================================
@@ -28,9 +48,16 @@ from pathlib import Path
 # Context window size (lines before and after vulnerable line)
 CONTEXT_LINES = 5
 
+# How many call-site code contexts to render per vulnerability group; the
+# remaining locations are still listed in the group's location table
+MAX_CONTEXTS_PER_GROUP = 3
+
 # Risk levels to remediate (in priority order)
 PRIORITY_RISKS = ["CRITICAL", "HIGH"]
 
+# Rank lookup so sorting never has to scan PRIORITY_RISKS with list.index
+_RANK = {risk: rank for rank, risk in enumerate(PRIORITY_RISKS)}
+
 
 # =============================================================================
 # STANDARD FIX DICTIONARY
@@ -82,6 +109,19 @@ STANDARD_FIXES = {
     },
 }
 
+# Normalize the lookup keys once at import time so get_standard_fix never has
+# to re-case its arguments, and flatten the bits-agnostic entries into their
+# own fallback table. MappingProxyType marks both as read-only rule tables.
+STANDARD_FIXES = MappingProxyType({
+    (algo.upper(), method.lower(), bits): fix
+    for (algo, method, bits), fix in STANDARD_FIXES.items()
+})
+_GENERAL_FIXES = MappingProxyType({
+    (algo, method): fix
+    for (algo, method, bits), fix in STANDARD_FIXES.items()
+    if bits is None
+})
+
 # PQC Migration Recommendations
 PQC_MIGRATIONS = {
     "RSA": "ML-KEM (Kyber) for key exchange, ML-DSA (Dilithium) for signatures",
@@ -92,10 +132,97 @@ PQC_MIGRATIONS = {
 }
 
 
+# =============================================================================
+# FINDING NORMALIZATION
+# =============================================================================
+
+def _to_int_bits(bits):
+    """Coerce a CBOM bits value to int, or None when unknown."""
+    if isinstance(bits, int):
+        return bits
+    if isinstance(bits, str):
+        try:
+            return int(bits)
+        except ValueError:
+            return None
+    return None
+
+
+def _normalize_findings(findings):
+    """
+    Canonicalize finding fields in place, once per run.
+
+    bits becomes int | None and algo/method are upper/lower-cased to match
+    the rule-table keys, so the per-finding hot paths never re-coerce types
+    or re-case strings.
+    """
+    for f in findings:
+        f['bits'] = _to_int_bits(f.get('bits'))
+        f['algo'] = f.get('algo', '').upper()
+        f['method'] = f.get('method', '').lower()
+
+
 # =============================================================================
 # CONTEXT EXTRACTION
 # =============================================================================
 
+# Memoized (buffer, line-offset index) pairs, keyed by (absolute path,
+# mtime_ns, size) so edits between runs invalidate naturally. Bounded so a
+# huge CBOM can't pin every scanned source file in memory at once.
+_FILE_CACHE = OrderedDict()
+_FILE_CACHE_MAX = 256
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _load_file_index(filepath):
+    """
+    Map a source file and index its newline offsets, caching by
+    (path, mtime_ns, size).
+
+    Returns (data, offsets): data is a read-only buffer of the file bytes
+    (an mmap when possible, so no full-file copy or per-line objects are
+    ever allocated) and offsets is an index where line i spans
+    data[offsets[i]:offsets[i + 1]], giving len(offsets) - 1 lines total.
+    Raises OSError (e.g. FileNotFoundError) like open() would.
+    """
+    abs_path = os.path.abspath(filepath)
+    st = os.stat(abs_path)
+    key = (abs_path, st.st_mtime_ns, st.st_size)
+
+    with _FILE_CACHE_LOCK:
+        entry = _FILE_CACHE.get(key)
+        if entry is not None:
+            _FILE_CACHE.move_to_end(key)
+            return entry
+
+    with open(abs_path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files can't be mapped; fall back to a plain read
+            data = f.read()
+
+    # Newline offsets found with C-level .find(); no line objects are built
+    offsets = array('q', [0])
+    pos = data.find(b'\n')
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = data.find(b'\n', pos + 1)
+    if offsets[-1] != len(data):
+        offsets.append(len(data))  # unterminated final line
+
+    entry = (data, offsets)
+
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = entry
+        if len(_FILE_CACHE) > _FILE_CACHE_MAX:
+            evicted, _ = _FILE_CACHE.popitem(last=False)[1]
+            if isinstance(evicted, mmap.mmap):
+                evicted.close()
+
+    return entry
+
+
 def extract_context(filepath, line_number, context_lines=CONTEXT_LINES):
     """
     Extract a context window around the vulnerable line.
@@ -104,43 +231,42 @@ def extract_context(filepath, line_number, context_lines=CONTEXT_LINES):
         filepath: Path to the source file
         line_number: 1-indexed line number of the vulnerability
         context_lines: Number of lines before and after to include
-    
+
     Returns:
-        dict with 'before', 'target', 'after' line lists and 'full' context string
+        dict with the numbered 'full' context string plus the 1-indexed
+        'start_line'/'end_line' of the window
     """
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        return {
-            "before": [],
-            "target": f"# ERROR: File not found: {filepath}",
-            "after": [],
-            "full": f"# ERROR: Could not read {filepath}"
-        }
-    
-    total_lines = len(lines)
+        data, offsets = _load_file_index(filepath)
+    except OSError:
+        return {"full": f"# ERROR: Could not read {filepath}"}
+
+    total_lines = len(offsets) - 1
     idx = line_number - 1  # Convert to 0-indexed
-    
+
     # Calculate range
-    start = max(0, idx - context_lines)
+    start = min(max(0, idx - context_lines), total_lines)
     end = min(total_lines, idx + context_lines + 1)
-    
-    before = lines[start:idx]
-    target = lines[idx] if idx < total_lines else ""
-    after = lines[idx + 1:end] if idx + 1 < total_lines else []
-    
-    # Build full context with line numbers
-    context_lines_numbered = []
-    for i, line in enumerate(lines[start:end], start=start + 1):
-        marker = " >> " if i == line_number else "    "
-        context_lines_numbered.append(f"{i:4d}{marker}{line.rstrip()}")
-    
+
+    # Slice and decode just the window; the rest of the file stays untouched
+    # behind the memory map
+    window = data[offsets[start]:offsets[max(start, end)]] \
+        .decode('utf-8', 'ignore').splitlines()
+    target_pos = idx - start if 0 <= idx - start < len(window) else None
+
+    # Build the numbered context in three marker-free passes (before, target,
+    # after) so the hot per-line f-string carries no conditional
+    full = "\n".join(chain(
+        (f"{n:4d}    {l.rstrip()}"
+         for n, l in enumerate(window[:idx - start], start + 1)),
+        (f"{idx + 1:4d} >> {window[target_pos].rstrip()}",)
+        if target_pos is not None else (),
+        (f"{n:4d}    {l.rstrip()}"
+         for n, l in enumerate(window[idx - start + 1:], idx + 2)),
+    ))
+
     return {
-        "before": [l.rstrip() for l in before],
-        "target": target.rstrip(),
-        "after": [l.rstrip() for l in after],
-        "full": "\n".join(context_lines_numbered),
+        "full": full,
         "start_line": start + 1,
         "end_line": end
     }
@@ -153,26 +279,18 @@ def extract_context(filepath, line_number, context_lines=CONTEXT_LINES):
 def get_standard_fix(algo, method, bits):
     """
     Look up a standard fix from the rule dictionary.
-    
+
     Args:
-        algo: Algorithm name (RSA, AES, etc.)
-        method: Method name (generate, new, etc.)
+        algo: Canonical algorithm name, upper-case (RSA, AES, etc.)
+        method: Canonical method name, lower-case (generate, new, etc.)
         bits: Key size in bits (or None)
-    
+
     Returns:
         Fix dictionary or None if no standard fix exists
     """
-    # Try exact match first
-    key = (algo.upper(), method.lower(), bits)
-    if key in STANDARD_FIXES:
-        return STANDARD_FIXES[key]
-    
-    # Try without bits (for general fixes)
-    key_general = (algo.upper(), method.lower(), None)
-    if key_general in STANDARD_FIXES:
-        return STANDARD_FIXES[key_general]
-    
-    return None
+    # Exact match first, then the bits-agnostic general fix
+    return (STANDARD_FIXES.get((algo, method, bits))
+            or _GENERAL_FIXES.get((algo, method)))
 
 
 def ask_llm_for_fix(code_snippet, finding):
@@ -208,10 +326,15 @@ def ask_llm_for_fix(code_snippet, finding):
     #     ]
     # )
     # return response.choices[0].message.content
-    
-    algo = finding.get('algo', 'Unknown')
+
+    return _placeholder_llm_fix(finding.get('algo', 'Unknown'))
+
+
+@lru_cache(maxsize=64)
+def _placeholder_llm_fix(algo):
+    """Render the deterministic placeholder fix text once per algorithm."""
     pqc_suggestion = PQC_MIGRATIONS.get(algo, "Consult NIST PQC standards")
-    
+
     return f"""# AI-GENERATED FIX (Placeholder)
 # TODO: Implement actual LLM call for intelligent fix generation
 # 
@@ -225,40 +348,49 @@ def ask_llm_for_fix(code_snippet, finding):
 """
 
 
+@lru_cache(maxsize=512)
+def _rule_fix_cached(algo_u, method_l, bits):
+    """
+    Memoized rule-engine lookup for a normalized (algo, method, bits) triple.
+
+    Duplicate findings (e.g. dozens of RSA-2048 call sites) resolve to the
+    same fix, so the result dict is built once and frozen for safe sharing.
+    """
+    standard = get_standard_fix(algo_u, method_l, bits)
+    if standard is None:
+        return None
+
+    return MappingProxyType({
+        "fix": standard["fix"],
+        "reason": standard["reason"],
+        "reference": standard.get("nist_ref", ""),
+        "source": "RULE_ENGINE",
+        "confidence": "HIGH"
+    })
+
+
 def generate_fix(finding, context):
     """
     Generate a fix for a vulnerability finding.
-    
+
     Args:
         finding: CBOM finding dictionary
         context: Extracted context dictionary
-    
+
     Returns:
         dict with suggested fix, reason, and source (rule/ai)
     """
+    # Fields are canonicalized up front by _normalize_findings, so no
+    # per-call re-casing or bits coercion is needed here
     algo = finding.get('algo', '')
     method = finding.get('method', '')
     bits = finding.get('bits')
-    
-    # Convert bits to int if possible
-    if isinstance(bits, str):
-        try:
-            bits = int(bits)
-        except ValueError:
-            bits = None
-    
+
     # Try standard fix first
-    standard = get_standard_fix(algo, method, bits)
-    
-    if standard:
-        return {
-            "fix": standard["fix"],
-            "reason": standard["reason"],
-            "reference": standard.get("nist_ref", ""),
-            "source": "RULE_ENGINE",
-            "confidence": "HIGH"
-        }
-    
+    rule_fix = _rule_fix_cached(algo, method, bits)
+    if rule_fix is not None:
+        return rule_fix
+
     # Fall back to LLM skeleton
     ai_fix = ask_llm_for_fix(context["full"], finding)
     return {
@@ -274,130 +406,227 @@ def generate_fix(finding, context):
 # REPORT GENERATOR
 # =============================================================================
 
+# Static report fragments, rendered once at import time instead of being
+# re-assembled append-by-append on every invocation. The header keeps a
+# {timestamp} slot for the one dynamic value.
+REPORT_HEADER = """\
+# 🛡️ Sentinel-PQC Remediation Plan
+
+> Generated: {timestamp}
+> Standard: NIST SP 800-208 (Post-Quantum Cryptography)
+
+---
+
+"""
+
+ROADMAP_MD = """\
+## 🚀 Post-Quantum Migration Roadmap
+
+| Current Algorithm | PQC Replacement | Timeline |
+|-------------------|-----------------|----------|
+| RSA (Key Exchange) | ML-KEM (Kyber-768/1024) | 2025-2030 |
+| RSA/DSA (Signatures) | ML-DSA (Dilithium) | 2025-2030 |
+| ECDSA/ECDH | Hybrid (ECC + ML-KEM) | 2024-2025 |
+| AES-128 | AES-256 (Grover's mitigation) | Immediate |
+
+> **Source:** NIST CNSA 2.0 Suite, NIST SP 800-208
+
+"""
+
+REPORT_FOOTER = """\
+---
+
+*Generated by Sentinel-PQC Remediator v1.0*"""
+
+# Per-group section templates, compiled once and rendered with a single
+# format_map call each instead of a dozen interleaved f-string writes
+_GROUP_HEADER_TEMPLATE = """\
+### {emoji} Vulnerability {index}: {algo}-{bits} via `{method}()` ({count} call site{plural})
+
+**Risk Level:** {risk}
+**Fix Source:** {source} ({confidence})
+
+**Affected Locations:**
+
+| File | Line |
+|------|------|
+"""
+
+_CONTEXT_TEMPLATE = """\
+`{file}` (Line {line}):
+```python
+{code}
+```
+
+"""
+
+_GROUP_FIX_TEMPLATE = """\
+**Sentinel Suggested Fix:**
+```python
+{fix}
+```
+
+**Rationale:** {reason}
+
+{reference}---
+
+"""
+
+def _write_group(f, index, group, contexts, fix_result):
+    """
+    Render one report section for a group of identical findings.
+
+    Args:
+        f: Open text file handle for the report
+        index: 1-based vulnerability group number
+        group: List of CBOM finding dictionaries sharing (algo, method, bits)
+        contexts: List of (finding, context) pairs for the rendered call sites
+        fix_result: Fix dictionary from generate_fix()
+    """
+    first = group[0]
+    bits = first.get('bits')
+    risk = first.get('risk', 'UNKNOWN')
+    count = len(group)
+    reference = fix_result.get('reference')
+
+    # One context dict drives both fixed-shape templates
+    ctx = {
+        "emoji": "🔴" if risk == "CRITICAL" else "🟡",
+        "index": index,
+        "algo": first.get('algo', 'Unknown'),
+        "bits": bits if bits is not None else 'Unknown',
+        "method": first.get('method', ''),
+        "count": count,
+        "plural": "s" if count != 1 else "",
+        "risk": risk,
+        "source": fix_result['source'],
+        "confidence": fix_result['confidence'],
+        "fix": fix_result['fix'],
+        "reason": fix_result['reason'],
+        "reference": f"**Reference:** {reference}\n\n" if reference else "",
+    }
+
+    f.write(_GROUP_HEADER_TEMPLATE.format_map(ctx))
+    for finding in group:
+        f.write(f"| `{finding.get('file', 'unknown')}` | {finding.get('line', '?')} |\n")
+    f.write("\n**Original Code:**\n\n")
+
+    for finding, context in contexts:
+        f.write(_CONTEXT_TEMPLATE.format_map({
+            "file": finding.get('file', 'unknown'),
+            "line": finding.get('line', '?'),
+            "code": context["full"],
+        }))
+    remaining = count - len(contexts)
+    if remaining > 0:
+        f.write(f"*...plus {remaining} more call site{'s' if remaining != 1 else ''} "
+                "listed in the table above.*\n\n")
+
+    f.write(_GROUP_FIX_TEMPLATE.format_map(ctx))
+
+
 def generate_remediation_plan(findings, base_path=".", output_path="REMEDIATION_PLAN.md"):
     """
     Generate a Markdown remediation plan from CBOM findings.
-    
+
+    The report is streamed section-by-section into the output file instead of
+    being accumulated in memory first, so peak memory stays bounded no matter
+    how many findings the CBOM contains.
+
     Args:
         findings: List of CBOM finding dictionaries
         base_path: Base path for resolving relative file paths
         output_path: Output Markdown file path
-    
+
     Returns:
         Path to generated report
     """
+    # Canonicalize types and casing once so the per-finding paths below
+    # (grouping keys, rule lookups) work on uniform values
+    _normalize_findings(findings)
+
     # Filter to priority risks
     priority_findings = [
-        f for f in findings 
-        if f.get('risk') in PRIORITY_RISKS
+        f for f in findings
+        if f.get('risk') in _RANK
     ]
-    
-    # Sort by risk level (CRITICAL first)
+
+    # Clean-scan fast path (the common CI case): skip the detailed sections
+    # and the roadmap entirely
+    if not priority_findings:
+        Path(output_path).write_text(
+            "# 🛡️ Sentinel-PQC Remediation Plan\n\n"
+            "✅ No CRITICAL or HIGH findings requiring remediation.\n",
+            encoding="utf-8",
+        )
+        return output_path
+
+    # Sort by risk level (CRITICAL first), then by file so findings against
+    # the same source file are processed back-to-back and hit the line cache
     priority_findings.sort(
-        key=lambda x: PRIORITY_RISKS.index(x.get('risk', 'HIGH'))
+        key=lambda f: (_RANK[f['risk']], f.get('file', ''))
     )
-    
-    # Build report
-    lines = []
-    
-    # Header
-    lines.append("# 🛡️ Sentinel-PQC Remediation Plan")
-    lines.append("")
-    lines.append(f"> Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"> Standard: NIST SP 800-208 (Post-Quantum Cryptography)")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Executive Summary
-    lines.append("## Executive Summary")
-    lines.append("")
+
+    # Group identical vulnerabilities so a CBOM with hundreds of duplicate
+    # call sites produces one write-up per unique issue instead of one per
+    # finding. Insertion order follows the risk-sorted findings, so CRITICAL
+    # groups still come first.
+    groups = OrderedDict()
+    for finding in priority_findings:
+        key = (finding.get('algo', 'Unknown'), finding.get('method', ''),
+               finding.get('bits'))
+        groups.setdefault(key, []).append(finding)
+
     critical_count = sum(1 for f in priority_findings if f.get('risk') == 'CRITICAL')
     high_count = sum(1 for f in priority_findings if f.get('risk') == 'HIGH')
-    lines.append(f"| Metric | Count |")
-    lines.append(f"|--------|-------|")
-    lines.append(f"| 🔴 CRITICAL Vulnerabilities | {critical_count} |")
-    lines.append(f"| 🟡 HIGH Vulnerabilities | {high_count} |")
-    lines.append(f"| **Total Requiring Remediation** | **{len(priority_findings)}** |")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Individual Findings
-    lines.append("## Detailed Remediation Steps")
-    lines.append("")
-    
-    for i, finding in enumerate(priority_findings, 1):
-        filepath = finding.get('file', 'unknown')
-        filename = Path(filepath).name
-        line = finding.get('line', '?')
-        algo = finding.get('algo', 'Unknown')
-        bits = finding.get('bits', 'Unknown')
-        risk = finding.get('risk', 'UNKNOWN')
-        context_str = finding.get('context', '')
-        
-        # Risk emoji
-        risk_emoji = "🔴" if risk == "CRITICAL" else "🟡"
-        
-        # Extract context
-        full_path = os.path.join(base_path, filepath)
-        context = extract_context(full_path, line)
-        
-        # Generate fix
-        fix_result = generate_fix(finding, context)
-        
-        # Write finding section
-        lines.append(f"### {risk_emoji} Vulnerability {i}: {algo}-{bits} in `{filename}`")
-        lines.append("")
-        lines.append(f"**Location:** `{filepath}` (Line {line})")
-        lines.append(f"**Risk Level:** {risk}")
-        lines.append(f"**Fix Source:** {fix_result['source']} ({fix_result['confidence']})")
-        lines.append("")
-        
-        lines.append("**Original Code:**")
-        lines.append("```python")
-        lines.append(context["full"])
-        lines.append("```")
-        lines.append("")
-        
-        lines.append("**Sentinel Suggested Fix:**")
-        lines.append("```python")
-        lines.append(fix_result["fix"])
-        lines.append("```")
-        lines.append("")
-        
-        lines.append(f"**Rationale:** {fix_result['reason']}")
-        lines.append("")
-        if fix_result.get('reference'):
-            lines.append(f"**Reference:** {fix_result['reference']}")
-            lines.append("")
-        
-        lines.append("---")
-        lines.append("")
-    
-    # PQC Migration Roadmap
-    lines.append("## 🚀 Post-Quantum Migration Roadmap")
-    lines.append("")
-    lines.append("| Current Algorithm | PQC Replacement | Timeline |")
-    lines.append("|-------------------|-----------------|----------|")
-    lines.append("| RSA (Key Exchange) | ML-KEM (Kyber-768/1024) | 2025-2030 |")
-    lines.append("| RSA/DSA (Signatures) | ML-DSA (Dilithium) | 2025-2030 |")
-    lines.append("| ECDSA/ECDH | Hybrid (ECC + ML-KEM) | 2024-2025 |")
-    lines.append("| AES-128 | AES-256 (Grover's mitigation) | Immediate |")
-    lines.append("")
-    lines.append("> **Source:** NIST CNSA 2.0 Suite, NIST SP 800-208")
-    lines.append("")
-    
-    # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append("*Generated by Sentinel-PQC Remediator v1.0*")
-    
-    # Write to file
-    report_content = "\n".join(lines)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(report_content)
-    
+
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        # Header
+        f.write(REPORT_HEADER.format(
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ))
+
+        # Executive Summary
+        f.write(
+            "## Executive Summary\n\n"
+            "| Metric | Count |\n"
+            "|--------|-------|\n"
+            f"| 🔴 CRITICAL Vulnerabilities | {critical_count} |\n"
+            f"| 🟡 HIGH Vulnerabilities | {high_count} |\n"
+            f"| Unique Vulnerability Classes | {len(groups)} |\n"
+            f"| **Total Requiring Remediation** | **{len(priority_findings)}** |\n\n"
+            "---\n\n"
+        )
+
+        # Individual Findings
+        f.write("## Detailed Remediation Steps\n\n")
+
+        def _prepare(item):
+            i, group = item
+            contexts = [
+                (finding, extract_context(
+                    os.path.join(base_path, finding.get('file', 'unknown')),
+                    finding.get('line', '?')))
+                for finding in group[:MAX_CONTEXTS_PER_GROUP]
+            ]
+            return i, group, contexts, generate_fix(group[0], contexts[0][1])
+
+        # Context extraction is I/O-bound, so fan the per-group work out
+        # across threads; executor.map preserves submission order, keeping
+        # the report writes sequential and deterministic.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i, group, contexts, fix_result in executor.map(
+                _prepare, enumerate(groups.values(), 1)
+            ):
+                _write_group(f, i, group, contexts, fix_result)
+
+        # PQC Migration Roadmap
+        f.write(ROADMAP_MD)
+
+        # Footer
+        f.write(REPORT_FOOTER)
+
     return output_path
 
 
@@ -405,6 +634,23 @@ def generate_remediation_plan(findings, base_path=".", output_path="REMEDIATION_
 # MAIN
 # =============================================================================
 
+# Banner encoded to UTF-8 bytes once at import so printing it is a single
+# buffer write with no per-run string construction or re-encoding
+_BANNER = """
+╔═══════════════════════════════════════════════════════════════════╗
+║                  SENTINEL-PQC REMEDIATOR                          ║
+║            AI-Powered Cryptographic Fix Engine                    ║
+╚═══════════════════════════════════════════════════════════════════╝
+    \n""".encode('utf-8')
+
+
+def print_banner():
+    """Display the remediator banner."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_BANNER)
+    sys.stdout.buffer.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Sentinel-PQC Remediator: Generate remediation plans for crypto vulnerabilities"
@@ -426,19 +672,14 @@ def main():
     )
     
     args = parser.parse_args()
-    
-    print("""
-╔═══════════════════════════════════════════════════════════════════╗
-║                  SENTINEL-PQC REMEDIATOR                          ║
-║            AI-Powered Cryptographic Fix Engine                    ║
-╚═══════════════════════════════════════════════════════════════════╝
-    """)
-    
+
+    print_banner()
+
     # Load CBOM
     print(f"📂 Loading CBOM from: {args.cbom}")
     try:
-        with open(args.cbom, "r") as f:
-            findings = json.load(f)
+        with open(args.cbom, "rb") as f:
+            findings = _json_loads(f.read())
     except FileNotFoundError:
         print(f"❌ Error: CBOM file not found: {args.cbom}")
         return 1
@@ -28,19 +28,67 @@ access patterns that match known cryptographic libraries.
 
 import tree_sitter_python
 from tree_sitter import Language, Parser
+import mmap
 import os
+import re
 import json
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# Query cursors are part of the 0.24+ bindings API; keep the pure-Python
+# tree walk as a fallback for older installations
+try:
+    from tree_sitter import Query, QueryCursor
+except ImportError:
+    Query = QueryCursor = None
+
+# orjson encodes CBOM assets several times faster than the stdlib encoder;
+# fall back to json so it stays an optional dependency. Both shims keep the
+# exact indent=2 layout the CBOM files have always used.
+try:
+    import orjson
+
+    def _json_dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _json_dumps_indented(obj):
+        return json.dumps(obj, indent=2)
 
 
 class PQCScanner:
     """
     Post-Quantum Cryptography Scanner using Tree-Sitter AST parsing.
-    
+
     The scanner identifies cryptographic function calls and classifies them
     based on their quantum-vulnerability risk level.
     """
-    
-    def __init__(self):
+
+    # Common non-source directories that are never descended into
+    _SKIP_DIRS = frozenset({
+        '__pycache__', '.git', 'node_modules', 'venv', '.venv', 'env',
+        '.mypy_cache', '.pytest_cache', 'dist', 'build'
+    })
+
+    # Node types the fallback tree walk never descends into: imports and
+    # literal leaves cannot syntactically contain a call site. Strings and
+    # decorators are deliberately absent — f-string interpolations and
+    # decorator expressions can hold calls, and pruning them would make the
+    # fallback diverge from the query engine.
+    _SKIP_SUBTREES = frozenset({
+        'comment', 'integer', 'float',
+        'import_statement', 'import_from_statement'
+    })
+
+    # Persistent findings cache shared by repeated scans (CI, IDE reruns)
+    _CACHE_DB = ".sentinel_cache.sqlite"
+
+    # Below this many files the process-pool startup costs more than the
+    # parallelism saves, so small scans stay in-process
+    _PARALLEL_MIN_FILES = 8
+
+    def __init__(self, use_cache=True):
         """
         Initialize the Tree-Sitter parser and define target patterns.
         
@@ -86,28 +134,119 @@ class PQCScanner:
             }
         }
         
+        # Freeze the per-target membership sets once so lookups are O(1)
+        # probes instead of list scans
+        for config in self.TARGETS.values():
+            config["methods"] = frozenset(config["methods"])
+            config["arg_keys"] = frozenset(config["arg_keys"])
+
+        # Argument-node dispatch for _extract_key_size: one dict lookup per
+        # argument child instead of chained type-string comparisons
+        self._arg_handlers = {
+            "integer": self._handle_positional_int,
+            "keyword_argument": self._handle_keyword_arg,
+        }
+
+        # Precompute the risk table for the common (algo, key size) pairs so
+        # the per-finding classification is one dict probe; unusual sizes
+        # fall back to _classify_risk and are memoized into the same table
+        self._risk_table = {}
+        common_key_sizes = {
+            "RSA": (0, 512, 768, 1024, 1536, 2048, 3072, 4096, 8192),
+            "DSA": (0, 512, 768, 1024, 1536, 2048, 3072, 4096),
+            "AES": (0, 128, 192, 256),
+            "EC": (0, 256, 384, 521),
+            "DES": (0, 56, 64, 168),
+        }
+        for algo, sizes in common_key_sizes.items():
+            for bits in sizes:
+                self._risk_table[(algo, bits)] = self._classify_risk(algo, bits)
+
         # Build reverse lookup: alias -> canonical name
         self._alias_map = {}
         for canonical, config in self.TARGETS.items():
             for alias in config.get("aliases", []):
                 self._alias_map[alias] = canonical
 
-    def _get_text(self, node, source_bytes):
-        """Extract the source text for a given AST node."""
-        return node.text.decode('utf8')
+        # Flat call index keyed on raw (object, method) identifier bytes:
+        # node.text is bytes, so one tuple probe classifies a candidate
+        # call with no decoding and no alias -> canonical -> config chain.
+        # Values carry the canonical name and that target's key-size
+        # argument names (shared frozensets, also bytes).
+        self._call_index = {}
+        for canonical, config in self.TARGETS.items():
+            config["arg_keys_b"] = frozenset(
+                k.encode('utf-8') for k in config["arg_keys"])
+            for alias in config.get("aliases", []):
+                alias_b = alias.encode('utf-8')
+                for method in config["methods"]:
+                    self._call_index[(alias_b, method.encode('utf-8'))] = (
+                        canonical, config["arg_keys_b"])
+
+        # Pre-parse filter: a file mentioning none of the known aliases
+        # cannot produce a finding, so it can be skipped without building a
+        # tree. All aliases are compiled into one alternation pattern so the
+        # file is swept in a single pass instead of once per needle; the
+        # pattern is derived from the alias table so the filter can never
+        # drop a detectable file.
+        self._sentinel_re = re.compile(b"|".join(
+            re.escape(alias.encode('utf-8'))
+            for alias in sorted(self._alias_map, key=len, reverse=True)
+        ))
+
+        # Pre-compiled S-expression query for object.method(...) call sites.
+        # Matching runs inside Tree-Sitter's C engine, so Python only ever
+        # sees candidate calls instead of walking every node itself.
+        self._call_query = None
+        if QueryCursor is not None:
+            self._call_query = Query(self.PY_LANGUAGE, """
+                (call
+                  function: (attribute
+                    object: (identifier) @obj
+                    attribute: (identifier) @method)
+                  arguments: (argument_list) @args) @call
+            """)
+
+        # STEP 3: Findings Cache
+        # ----------------------
+        # Re-scans of unchanged files skip parsing entirely: findings are
+        # stored in SQLite keyed by (path, mtime_ns, size). WAL mode keeps
+        # concurrent readers cheap; cache failures silently disable caching.
+        self._cache_conn = None
+        if use_cache:
+            try:
+                self._cache_conn = sqlite3.connect(self._CACHE_DB)
+                self._cache_conn.execute("PRAGMA journal_mode=WAL")
+                self._cache_conn.execute("PRAGMA synchronous=NORMAL")
+                self._cache_conn.execute(
+                    "CREATE TABLE IF NOT EXISTS findings "
+                    "(key TEXT PRIMARY KEY, json BLOB)"
+                )
+            except sqlite3.Error:
+                self._cache_conn = None
 
     def _calculate_risk(self, algo, bits):
         """
         Calculate Post-Quantum risk level based on NIST guidelines.
-        
+
+        algo is expected in canonical (upper-case) form. The answer comes
+        from the precomputed table for common (algo, bits) pairs; uncommon
+        sizes fall through to the branchy classifier once and are memoized.
+
         Risk Levels:
         - CRITICAL: Algorithm is already broken or easily breakable
         - HIGH: Vulnerable to known quantum algorithms (Shor's, Grover's)
         - MEDIUM: Reduced security margin in post-quantum world
         - LOW: Considered quantum-resistant or quantum-safe
         """
-        algo = algo.upper()
-        
+        risk = self._risk_table.get((algo, bits))
+        if risk is None:
+            risk = self._classify_risk(algo, bits)
+            self._risk_table[(algo, bits)] = risk
+        return risk
+
+    def _classify_risk(self, algo, bits):
+        """Branchy risk classification; only runs on risk-table misses."""
         # Handle cases where key size couldn't be extracted
         if not bits or bits == 0:
             return "UNKNOWN"
@@ -150,130 +289,197 @@ class PQCScanner:
         """
         return self._alias_map.get(name, name)
 
+    def _handle_positional_int(self, child, arg_keys):
+        """
+        Positional integer argument, e.g. RSA.generate(2048).
+
+        We take the first integer that looks like a key size. Sanity check:
+        RSA keys > 512 bits, AES keys 128/192/256; e=65537 is the common
+        RSA exponent, skip it.
+        """
+        val = int(child.text)
+        if val >= 128 and val != 65537:
+            return val
+        return None
+
+    def _handle_keyword_arg(self, child, arg_keys):
+        """
+        Keyword argument, e.g. RSA.generate(bits=2048) or AES.new(key=b'...').
+
+        keyword_argument node structure:
+          keyword_argument
+            name: identifier "bits"
+            value: integer 2048
+        """
+        arg_name_node = child.child_by_field_name("name")
+        arg_val_node = child.child_by_field_name("value")
+        if not (arg_name_node and arg_val_node):
+            return None
+
+        # Only extract if this is a known key size parameter
+        # (compared as raw bytes, no decode)
+        if arg_name_node.text not in arg_keys:
+            return None
+
+        if arg_val_node.type == "integer":
+            return int(arg_val_node.text)
+        # For AES, key might be bytes - estimate from length
+        if arg_val_node.type in ("string", "binary_string"):
+            # b'16_byte_key!!!!!' -> 16 bytes = 128 bits
+            key_text = arg_val_node.text
+            # Remove quotes: b'...' or '...'
+            key_bytes = len(key_text) - 3 if key_text.startswith(b"b") else len(key_text) - 2
+            return key_bytes * 8
+        return None
+
     def _extract_key_size(self, args_node, arg_keys):
         """
         Extract key size from function arguments.
-        
+
         Handles two cases:
         1. Positional: RSA.generate(2048)
         2. Keyword: RSA.generate(bits=2048) or RSA.generate(e=65537, bits=2048)
-        
+
         The tricky part is distinguishing key sizes from other integers like
         the public exponent (e=65537). We use heuristics:
         - Key sizes are typically > 64 bits
         - Named arguments matching known keys take priority
+
+        Argument node types dispatch through a handler dict, so adding
+        support for a new node type (e.g. call for ec.SECP256R1()) is one
+        table entry.
         """
-        key_size = 0
-        
         if not args_node:
             return 0
-            
+
+        handlers = self._arg_handlers
         for child in args_node.children:
-            # Case A: Positional Integer Argument
-            # -----------------------------------
-            # e.g., RSA.generate(2048)
-            # We take the first integer that looks like a key size (> 64)
-            if child.type == "integer":
-                val = int(self._get_text(child, None))
-                # Sanity check: RSA keys > 512 bits, AES keys 128/192/256
-                # e=65537 is the common RSA exponent, skip it
-                if val >= 128 and val != 65537:
-                    key_size = val
-                    break
-            
-            # Case B: Keyword Argument
-            # ------------------------
-            # e.g., RSA.generate(bits=2048) or AES.new(key=b'...', mode=...)
-            # keyword_argument node structure:
-            #   keyword_argument
-            #     name: identifier "bits"
-            #     value: integer 2048
-            elif child.type == "keyword_argument":
-                arg_name_node = child.child_by_field_name("name")
-                arg_val_node = child.child_by_field_name("value")
-                
-                if arg_name_node and arg_val_node:
-                    arg_name = self._get_text(arg_name_node, None)
-                    
-                    # Only extract if this is a known key size parameter
-                    if arg_name in arg_keys:
-                        if arg_val_node.type == "integer":
-                            key_size = int(self._get_text(arg_val_node, None))
-                            break
-                        # For AES, key might be bytes - estimate from length
-                        elif arg_val_node.type in ["string", "binary_string"]:
-                            # b'16_byte_key!!!!!' -> 16 bytes = 128 bits
-                            key_text = self._get_text(arg_val_node, None)
-                            # Remove quotes: b'...' or '...'
-                            key_bytes = len(key_text) - 3 if key_text.startswith("b") else len(key_text) - 2
-                            key_size = key_bytes * 8
-                            break
-        
-        return key_size
+            handler = handlers.get(child.type)
+            if handler is not None:
+                val = handler(child, arg_keys)
+                if val is not None:
+                    return val
 
-    def _find_calls(self, node, source_code, results):
+        return 0
+
+    def _match_candidate(self, obj_node, method_node, args_node, call_node,
+                         source_code):
         """
-        Recursively traverse the AST to find function calls.
-        
-        TRAVERSAL LOGIC:
-        1. Check if current node is a 'call' node
-        2. If so, extract function (object.method) and arguments
-        3. Check if object matches a known crypto library
-        4. Check if method is a key-generation function
-        5. Extract key size and calculate risk
-        6. Add to results if it's a crypto call
-        7. Recurse into all child nodes
+        Classify one object.method() candidate call, returning a finding
+        dict if it targets a known crypto library and None otherwise.
+
+        MATCHING LOGIC:
+        1. Probe the flat (object, method) call index — one lookup covers
+           alias resolution, library match and method match at once
+        2. Extract key size and calculate risk
+        3. Build the finding record
         """
-        # Check if this is a function call
-        if node.type == "call":
-            # Get the function being called (e.g., RSA.generate)
-            func = node.child_by_field_name("function")
-            args = node.child_by_field_name("arguments")
-            
-            # We're looking for attribute access: object.method()
-            if func and func.type == "attribute":
-                obj_node = func.child_by_field_name("object")
-                method_node = func.child_by_field_name("attribute")
-                
-                if obj_node and method_node:
-                    obj_name = self._get_text(obj_node, source_code)
-                    method_name = self._get_text(method_node, source_code)
-                    
-                    # FILTER 1: Is this a known crypto library?
-                    # Resolve aliases (e.g., PyRSA -> RSA)
-                    canonical_name = self._resolve_alias(obj_name)
-                    target_config = self.TARGETS.get(canonical_name)
-                    
-                    if target_config:
-                        # FILTER 2: Is this a key generation method?
-                        if method_name in target_config["methods"]:
-                            # STEP 5: Extract the key size
-                            key_size = self._extract_key_size(
-                                args, 
-                                target_config["arg_keys"]
-                            )
-                            
-                            # STEP 6: Calculate risk
-                            risk = self._calculate_risk(canonical_name, key_size)
-                            
-                            # STEP 7: Build the finding
-                            context = self._get_text(node, source_code)
-                            
-                            finding = {
-                                "file": "",  # Will be set by scan_file
-                                "line": node.start_point[0] + 1,  # 1-indexed
-                                "algo": canonical_name,
-                                "method": method_name,
-                                "bits": key_size if key_size else "Unknown",
-                                "risk": risk,
-                                "context": context[:100]  # Truncate long lines
-                            }
-                            
-                            results.append(finding)
-        
-        # Recurse into all children
-        for child in node.children:
-            self._find_calls(child, source_code, results)
+        method_b = method_node.text
+
+        # Single probe: misses reject the candidate with no decoding, hits
+        # hand back the canonical name and this target's key-size arg names
+        hit = self._call_index.get((obj_node.text, method_b))
+        if hit is None:
+            return None
+        canonical_name, arg_keys_b = hit
+
+        # Extract the key size and calculate risk
+        key_size = self._extract_key_size(args_node, arg_keys_b)
+        risk = self._calculate_risk(canonical_name, key_size)
+
+        # Build the finding. The context snippet is truncated at the byte
+        # level before decoding, so a match inside a huge multi-line call
+        # never pays to decode more than the ~100 bytes that get stored
+        # ('ignore' drops a partial code point cut by the truncation)
+        start_byte = call_node.start_byte
+        context = source_code[
+            start_byte:min(call_node.end_byte, start_byte + 100)
+        ].decode('utf8', errors='ignore')
+
+        # Intern the low-cardinality fields so every finding shares one str
+        # object per unique algorithm/method/risk value instead of carrying
+        # its own copy (the decoded method name in particular is a fresh
+        # string per match)
+        return {
+            "file": "",  # Will be set by scan_file
+            "line": call_node.start_point[0] + 1,  # 1-indexed
+            "algo": sys.intern(canonical_name),
+            "method": sys.intern(method_b.decode('utf8')),
+            "bits": key_size if key_size else "Unknown",
+            "risk": sys.intern(risk),
+            "context": context
+        }
+
+    def _find_calls_query(self, root_node, source_code):
+        """
+        Yield crypto-call findings via the pre-compiled Tree-Sitter query.
+
+        The S-expression matcher traverses the whole tree natively, so the
+        Python loop below only touches pre-filtered object.method() calls
+        instead of visiting every node in the file.
+        """
+        match_candidate = self._match_candidate
+        for _pattern, captures in QueryCursor(self._call_query).matches(root_node):
+            finding = match_candidate(
+                captures["obj"][0],
+                captures["method"][0],
+                captures["args"][0],
+                captures["call"][0],
+                source_code
+            )
+            if finding is not None:
+                yield finding
+
+    def _find_calls(self, node, source_code):
+        """
+        Traverse the AST with a TreeCursor, yielding crypto-call findings.
+
+        Fallback for bindings without the query cursor API; the query path
+        in _find_calls_query does the same matching natively. The cursor
+        navigates on the C side, so no per-level node.children lists are
+        materialized and no Python stack frames pile up on deep trees.
+        """
+        cursor = node.walk()
+
+        # Bind the per-node lookups to locals once: at millions of node
+        # visits the repeated attribute resolution on self and cursor is a
+        # measurable share of the loop
+        match_candidate = self._match_candidate
+        goto_first_child = cursor.goto_first_child
+        goto_next_sibling = cursor.goto_next_sibling
+        goto_parent = cursor.goto_parent
+        skip_subtrees = self._SKIP_SUBTREES
+
+        while True:
+            current = cursor.node
+
+            # Check if this is a function call
+            if current.type == "call":
+                # Get the function being called (e.g., RSA.generate)
+                func = current.child_by_field_name("function")
+
+                # We're looking for attribute access: object.method()
+                if func and func.type == "attribute":
+                    obj_node = func.child_by_field_name("object")
+                    method_node = func.child_by_field_name("attribute")
+
+                    if obj_node and method_node:
+                        finding = match_candidate(
+                            obj_node, method_node,
+                            current.child_by_field_name("arguments"),
+                            current, source_code
+                        )
+                        if finding is not None:
+                            yield finding
+
+            # Depth-first: descend when possible (pruning subtrees that
+            # cannot contain call sites), otherwise advance to the next
+            # sibling, unwinding to parents until one exists
+            if current.type not in skip_subtrees and goto_first_child():
+                continue
+            while not goto_next_sibling():
+                if not goto_parent():
+                    return
 
     def scan_file(self, filepath):
         """
@@ -288,63 +494,186 @@ class PQCScanner:
         Returns:
             List of findings as dictionaries ready for JSON serialization
         """
-        results = []
-        
-        # STEP 1: Read the source file
+        # STEP 1: Check the findings cache
+        # The key is (path, mtime_ns, size) — a near-free invalidation
+        # check that catches edits without reading the file, so a cache hit
+        # costs one stat plus one SELECT and never opens the file at all
+        cache_key = None
+        if self._cache_conn is not None:
+            try:
+                st = os.stat(filepath)
+            except OSError as e:
+                print(f"[ERROR] Cannot read {filepath}: {e}")
+                return []
+            cache_key = f"{filepath}:{st.st_mtime_ns}:{st.st_size}"
+            row = self._cache_conn.execute(
+                "SELECT json FROM findings WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is not None:
+                return json.loads(row[0])
+
+        # STEP 2: Open the source file and memory-map it
+        # The OS page cache backs the mapping directly, so the pre-filter
+        # and cache hashing below touch the file without copying it into a
+        # bytes object. Empty files can't be mapped and fall back to read().
         try:
             with open(filepath, 'rb') as f:
-                source_code = f.read()
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    source_code = None
+                except (ValueError, OSError):
+                    mm = None
+                    source_code = f.read()
         except Exception as e:
             print(f"[ERROR] Cannot read {filepath}: {e}")
             return []
-        
-        # STEP 2: Parse into AST
+
+        try:
+            buf = mm if mm is not None else source_code
+
+            # STEP 3: Cheap literal pre-filter
+            # One compiled-alternation sweep over the mapped bytes; bailing
+            # out here skips the (much more expensive) tree build for the
+            # majority of files, which are never copied out of the page
+            # cache at all. The empty result is cached too, so the next run
+            # doesn't even re-run the sweep.
+            if self._sentinel_re.search(buf) is None:
+                if cache_key is not None:
+                    self._store_cached_findings(cache_key, [])
+                return []
+
+            # Only files that survive the filter pay for a full in-memory
+            # copy (parser.parse requires bytes)
+            if mm is not None:
+                source_code = bytes(mm)
+        finally:
+            if mm is not None:
+                mm.close()
+
+        # STEP 4: Parse into AST
         # The parser.parse() returns a Tree object with a root_node
         tree = self.parser.parse(source_code)
         
-        # STEP 3: Traverse and find crypto calls
-        self._find_calls(tree.root_node, source_code, results)
-        
-        # STEP 4: Add file path to all results
+        # STEP 5: Traverse and find crypto calls (native query engine when
+        # available, Python tree walk otherwise). The traversals are
+        # generators; materialize here since the findings are cached and
+        # returned as a list.
+        if self._call_query is not None:
+            results = list(self._find_calls_query(tree.root_node, source_code))
+        else:
+            results = list(self._find_calls(tree.root_node, source_code))
+
+        # STEP 6: Add file path to all results; normalize once, not per
+        # finding — every result shares the same path string anyway
+        normalized_path = os.path.normpath(filepath)
         for result in results:
-            result["file"] = os.path.normpath(filepath)
-        
+            result["file"] = normalized_path
+
+        # STEP 7: Store in the findings cache for the next run
+        if cache_key is not None:
+            self._store_cached_findings(cache_key, results)
+
         return results
 
+    def _store_cached_findings(self, cache_key, results):
+        """Persist one file's findings under its (path, mtime, size) key."""
+        self._cache_conn.execute(
+            "INSERT OR REPLACE INTO findings VALUES (?, ?)",
+            (cache_key, json.dumps(results))
+        )
+        self._cache_conn.commit()
+
+    def _collect_source_files(self, dirpath, extensions):
+        """
+        Walk a directory tree and return the list of scannable file paths.
+
+        Uses os.scandir rather than os.walk: DirEntry objects carry the file
+        type from the directory read itself, so classifying each entry needs
+        no extra stat syscalls.
+        """
+        filepaths = []
+
+        stack = [dirpath]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError as e:
+                print(f"[ERROR] Cannot list {current}: {e}")
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip common non-source directories
+                        if entry.name not in self._SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(extensions) and entry.is_file(follow_symlinks=False):
+                        filepaths.append(entry.path)
+
+        return filepaths
+
     def scan_directory(self, dirpath, extensions=('.py',)):
         """
         Recursively scan a directory for Python files.
-        
+
+        Files are independent, so large scans fan out across a process pool
+        (tree-sitter parsing holds the GIL in the Python bindings, making
+        threads ineffective here); each worker builds its own scanner once
+        and they share the SQLite cache through WAL mode.
+
         Args:
             dirpath: Path to directory to scan
             extensions: Tuple of file extensions to include
-            
+
         Returns:
             List of all findings from all files
         """
+        filepaths = self._collect_source_files(dirpath, extensions)
         all_results = []
-        
-        for root, dirs, files in os.walk(dirpath):
-            # Skip common non-source directories
-            dirs[:] = [d for d in dirs if d not in {
-                '__pycache__', '.git', 'node_modules', 'venv', '.venv', 'env'
-            }]
-            
-            for file in files:
-                if file.endswith(extensions):
-                    filepath = os.path.join(root, file)
-                    results = self.scan_file(filepath)
-                    all_results.extend(results)
-        
+
+        if len(filepaths) < self._PARALLEL_MIN_FILES:
+            for filepath in filepaths:
+                all_results.extend(self.scan_file(filepath))
+            return all_results
+
+        with ProcessPoolExecutor() as executor:
+            for results in executor.map(_scan_one, filepaths, chunksize=16):
+                all_results.extend(results)
+
         return all_results
 
+    @staticmethod
+    def _cbom_asset(finding):
+        """Convert one finding dict into a CycloneDX crypto asset."""
+        return {
+            "type": "algorithm",
+            "name": finding["algo"],
+            "occurrences": [{
+                "location": finding["file"],
+                "line": finding["line"],
+                "context": finding["context"]
+            }],
+            "properties": [
+                {"name": "keySize", "value": str(finding["bits"])},
+                {"name": "method", "value": finding["method"]},
+                {"name": "quantumRisk", "value": finding["risk"]}
+            ]
+        }
+
     def generate_cbom(self, findings, output_path=None):
         """
         Generate a CycloneDX-compatible CBOM (Cryptographic Bill of Materials).
-        
+
         The output follows CycloneDX 1.6 structure for cryptographic assets.
+
+        findings may be any iterable. When output_path is given the asset
+        array is streamed to disk one finding at a time — the envelope is
+        written around it manually, so no second, assets-shaped copy of the
+        findings is ever built in memory — and None is returned. Without an
+        output_path the fully populated CBOM dict is returned.
         """
-        cbom = {
+        envelope = {
             "bomFormat": "CycloneDX",
             "specVersion": "1.6",
             "version": 1,
@@ -355,31 +684,40 @@ class PQCScanner:
                     "version": "1.0.0"
                 }
             },
-            "cryptoAssets": []
         }
-        
-        for finding in findings:
-            asset = {
-                "type": "algorithm",
-                "name": finding["algo"],
-                "occurrences": [{
-                    "location": finding["file"],
-                    "line": finding["line"],
-                    "context": finding["context"]
-                }],
-                "properties": [
-                    {"name": "keySize", "value": str(finding["bits"])},
-                    {"name": "method", "value": finding["method"]},
-                    {"name": "quantumRisk", "value": finding["risk"]}
-                ]
-            }
-            cbom["cryptoAssets"].append(asset)
-        
-        if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(cbom, f, indent=2)
-                
-        return cbom
+
+        if not output_path:
+            envelope["cryptoAssets"] = [self._cbom_asset(f) for f in findings]
+            return envelope
+
+        with open(output_path, 'w') as f:
+            # Splice a streamed cryptoAssets array into the envelope: drop
+            # the envelope's closing brace, emit each asset as it is built,
+            # then close the array and the document by hand
+            head = _json_dumps_indented(envelope)
+            f.write(head[:head.rfind('\n')])
+            f.write(',\n  "cryptoAssets": [')
+            first = True
+            for finding in findings:
+                asset = _json_dumps_indented(self._cbom_asset(finding))
+                f.write('\n' if first else ',\n')
+                f.write('\n'.join('    ' + line for line in asset.splitlines()))
+                first = False
+            f.write('\n  ]\n}' if not first else ']\n}')
+        return None
+
+
+# Worker-side helpers for the scan_directory process pool. The scanner is
+# built lazily once per worker (lru_cache keeps a single instance) so each
+# process loads the grammar exactly once.
+@lru_cache(maxsize=1)
+def _worker_scanner():
+    return PQCScanner()
+
+
+def _scan_one(filepath):
+    """Scan a single file inside a pool worker."""
+    return _worker_scanner().scan_file(filepath)
 
 
 # Convenience function for quick scanning